@@ -18,78 +18,317 @@ Usage:
     deep_mind.py path <matrix>
 """
 
-import json
 import sys
 import os
-from pathlib import Path
-from datetime import datetime
 
-BASE_DIR = Path.home() / ".claude" / "deep-mind"
+# Imports beyond sys/os are deferred to the code paths that need them so
+# light commands such as `path` and `detect` start quickly.
+
+_JSON = None
+
+
+def _json_backend():
+    """Return (loads, dumps), preferring orjson over the stdlib json module."""
+    global _JSON
+    if _JSON is None:
+        try:
+            import orjson
+
+            _JSON = (
+                orjson.loads,
+                lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2),
+            )
+        except ImportError:
+            import json
+
+            _JSON = (
+                json.loads,
+                lambda obj: json.dumps(obj, indent=2, ensure_ascii=False).encode(),
+            )
+    return _JSON
+
+
+def _loads(data):
+    return _json_backend()[0](data)
+
+
+def _dumps(obj):
+    return _json_backend()[1](obj)
+
+
+BASE_DIR = os.path.join(os.path.expanduser("~"), ".claude", "deep-mind")
+
+# On-disk layout written by this script. Layout 1 (no "layout" key) kept
+# projects and verticals inline in manifest.json; layout 2 moves them to
+# projects/<name>.json, projects.index and verticals.txt.
+LAYOUT_VERSION = 2
+
+# Parsed manifests keyed by matrix name, stored as (mtime_ns, manifest) so a
+# single CLI invocation parses each manifest.json at most once.
+_MANIFEST_CACHE = {}
+
+
+_NOW_CACHE = None
+
+
+def _now():
+    # One timestamp per command so the manifest, project config and
+    # changelog entry it writes all agree; main() resets it per dispatch.
+    global _NOW_CACHE
+    if _NOW_CACHE is None:
+        from datetime import datetime
+
+        _NOW_CACHE = datetime.now()
+    return _NOW_CACHE
 
 
 def get_matrix_dir(name):
-    return BASE_DIR / name
+    return os.path.join(BASE_DIR, name)
+
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _write_atomic(path, data):
+    """Write bytes to a temp file and rename it over path, so readers never
+    see a half-written file."""
+    import tempfile
+
+    # A unique temp name per writer so concurrent saves cannot clobber it
+    fd, tmp = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with open(fd, "wb", buffering=1 << 16) as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def load_manifest(matrix):
-    manifest_path = get_matrix_dir(matrix) / "manifest.json"
-    if not manifest_path.exists():
+    manifest_path = os.path.join(get_matrix_dir(matrix), "manifest.json")
+    try:
+        mtime = os.stat(manifest_path).st_mtime_ns
+    except FileNotFoundError:
+        _MANIFEST_CACHE.pop(matrix, None)
         return None
-    return json.loads(manifest_path.read_text())
+
+    cached = _MANIFEST_CACHE.get(matrix)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    manifest = _loads(_read_bytes(manifest_path))
+    _MANIFEST_CACHE[matrix] = (mtime, manifest)
+    return manifest
 
 
 def save_manifest(matrix, manifest):
-    manifest_path = get_matrix_dir(matrix) / "manifest.json"
-    manifest_path.write_text(json.dumps(manifest, indent=2))
+    manifest_path = os.path.join(get_matrix_dir(matrix), "manifest.json")
+    _write_atomic(manifest_path, _dumps(manifest))
+    _MANIFEST_CACHE[matrix] = (os.stat(manifest_path).st_mtime_ns, manifest)
+
+
+def _is_legacy(manifest):
+    return manifest.get("layout", 1) < LAYOUT_VERSION
+
+
+def _legacy_field(matrix, key):
+    """Return ``key`` from a manifest still in the monolithic layout, else None."""
+    manifest = load_manifest(matrix)
+    return manifest.get(key) if manifest and _is_legacy(manifest) else None
+
+
+def _ensure_migrated(matrix):
+    """Split a legacy monolithic manifest into per-project files and verticals.txt.
+
+    Only commands that modify a matrix call this; the readers understand both
+    layouts, so listing a legacy matrix never rewrites it.
+    """
+    manifest = load_manifest(matrix)
+    if not manifest or not _is_legacy(manifest):
+        return
+    manifest = dict(manifest)
+    for pname, pinfo in manifest.pop("projects", {}).items():
+        save_project(matrix, pname, pinfo)
+    if "verticals" in manifest:
+        save_verticals(matrix, dict.fromkeys(manifest.pop("verticals")))
+    manifest["layout"] = LAYOUT_VERSION
+    # Written last: until the manifest is stripped the legacy copy stays
+    # authoritative, so an interrupted migration is simply redone.
+    save_manifest(matrix, manifest)
+
+
+def _escape_name(name):
+    # Keeps "org/repo" or "../x" inside projects/ and one name per index line
+    return (
+        name.replace("%", "%25")
+        .replace("/", "%2F")
+        .replace("\\", "%5C")
+        .replace("\n", "%0A")
+    )
+
+
+def _unescape_name(name):
+    return (
+        name.replace("%0A", "\n")
+        .replace("%5C", "\\")
+        .replace("%2F", "/")
+        .replace("%25", "%")
+    )
+
+
+def _project_file(matrix, project_name):
+    fname = f"{_escape_name(project_name)}.json"
+    return os.path.join(get_matrix_dir(matrix), "projects", fname)
+
+
+def load_project(matrix, project_name):
+    legacy = _legacy_field(matrix, "projects")
+    if legacy is not None:
+        return legacy.get(project_name)
+    try:
+        return _loads(_read_bytes(_project_file(matrix, project_name)))
+    except FileNotFoundError:
+        return None
+
+
+def _projects_index(matrix):
+    return os.path.join(get_matrix_dir(matrix), "projects.index")
+
+
+def _read_projects_index(matrix):
+    try:
+        data = _read_bytes(_projects_index(matrix))
+    except FileNotFoundError:
+        return []
+    return list(dict.fromkeys(n for n in data.decode().split("\n") if n))
+
+
+def load_projects(matrix):
+    """Return {name: info} for every project, in registration order.
+
+    Order comes from ``projects.index`` (escaped names, one per line); files
+    missing from the index follow, sorted by name.
+    """
+    legacy = _legacy_field(matrix, "projects")
+    if legacy is not None:
+        return dict(legacy)
+
+    files = {}
+    try:
+        with os.scandir(os.path.join(get_matrix_dir(matrix), "projects")) as it:
+            for e in it:
+                if e.name.endswith(".json") and e.is_file():
+                    files[e.name[:-5]] = e.path
+    except FileNotFoundError:
+        pass
+
+    order = [n for n in _read_projects_index(matrix) if n in files]
+    order += sorted(set(files) - set(order))
+    return {_unescape_name(n): _loads(_read_bytes(files[n])) for n in order}
+
+
+def save_project(matrix, project_name, info):
+    pdir = os.path.join(get_matrix_dir(matrix), "projects")
+    os.makedirs(pdir, exist_ok=True)
+    path = _project_file(matrix, project_name)
+    is_new = not os.path.exists(path)
+    _write_atomic(path, _dumps(info))
+    # Re-registering keeps the project's original position
+    if is_new:
+        with open(_projects_index(matrix), "ab") as f:
+            f.write(f"{os.path.basename(path)[:-5]}\n".encode())
+
+
+def delete_project(matrix, project_name):
+    path = _project_file(matrix, project_name)
+    os.unlink(path)
+    encoded = os.path.basename(path)[:-5]
+    names = [n for n in _read_projects_index(matrix) if n != encoded]
+    _write_atomic(_projects_index(matrix), "".join(f"{n}\n" for n in names).encode())
+
+
+def load_verticals(matrix):
+    """Return verticals as an insertion-ordered dict (an ordered set) so
+    membership checks are O(1) while listings keep their file order."""
+    legacy = _legacy_field(matrix, "verticals")
+    if legacy is not None:
+        return dict.fromkeys(legacy)
+    try:
+        data = _read_bytes(os.path.join(get_matrix_dir(matrix), "verticals.txt"))
+    except FileNotFoundError:
+        return {}
+    return dict.fromkeys(v for v in data.decode().split("\n") if v)
+
+
+def save_verticals(matrix, verticals):
+    _write_atomic(
+        os.path.join(get_matrix_dir(matrix), "verticals.txt"),
+        "".join(f"{v}\n" for v in verticals).encode(),
+    )
+
+
+def append_vertical(matrix, vertical_name):
+    with open(os.path.join(get_matrix_dir(matrix), "verticals.txt"), "ab") as f:
+        f.write(f"{vertical_name}\n".encode())
+
+
+def _require_matrix(matrix):
+    """Return the matrix directory, or None if the matrix does not exist."""
+    mdir = get_matrix_dir(matrix)
+    return mdir if os.path.isdir(mdir) else None
 
 
 def init_matrix(name):
     mdir = get_matrix_dir(name)
-    if mdir.exists():
+    if os.path.exists(mdir):
         print(f"Matrix '{name}' already exists at {mdir}")
         return True
 
-    mdir.mkdir(parents=True)
+    os.makedirs(os.path.join(mdir, "projects"))
 
     manifest = {
         "name": name,
-        "created": datetime.now().isoformat(),
-        "projects": {},
-        "verticals": [],
+        "created": _now().isoformat(),
+        "layout": LAYOUT_VERSION,
     }
     save_manifest(name, manifest)
+    save_verticals(name, {})
 
-    (mdir / "changelog.md").write_text(
-        f"# Changelog\n\n## {datetime.now().strftime('%Y-%m-%d %H:%M')}\n- Matrix '{name}' created\n"
-    )
+    log_change(name, f"Matrix '{name}' created")
 
     print(f"Matrix '{name}' initialized at {mdir}")
     return True
 
 
 def register_project(matrix, project_name, project_path=None):
-    mdir = get_matrix_dir(matrix)
-    if not mdir.exists():
+    mdir = _require_matrix(matrix)
+    if mdir is None:
         print(f"Error: Matrix '{matrix}' does not exist. Run init first.")
         return False
 
-    manifest = load_manifest(matrix)
+    _ensure_migrated(matrix)
     path = project_path or os.getcwd()
+    registered = _now().isoformat()
 
-    manifest["projects"][project_name] = {
-        "path": str(path),
-        "registered": datetime.now().isoformat(),
-    }
-    save_manifest(matrix, manifest)
+    save_project(matrix, project_name, {"path": str(path), "registered": registered})
 
     project_config = {
         "matrix": matrix,
         "project": project_name,
-        "registered": datetime.now().isoformat(),
+        "registered": registered,
     }
-    config_path = Path(path) / ".deep-mind.json"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(json.dumps(project_config, indent=2))
+    os.makedirs(path, exist_ok=True)
+    config_path = os.path.join(path, ".deep-mind.json")
+    with open(config_path, "wb") as f:
+        f.write(_dumps(project_config))
 
     log_change(matrix, f"Project '{project_name}' registered ({path})")
 
@@ -99,25 +338,26 @@ def register_project(matrix, project_name, project_path=None):
 
 
 def unregister_project(matrix, project_name):
-    mdir = get_matrix_dir(matrix)
-    if not mdir.exists():
+    mdir = _require_matrix(matrix)
+    if mdir is None:
         print(f"Error: Matrix '{matrix}' does not exist.")
         return False
 
-    manifest = load_manifest(matrix)
+    _ensure_migrated(matrix)
+    project = load_project(matrix, project_name)
 
-    if project_name not in manifest["projects"]:
+    if project is None:
         print(f"Error: Project '{project_name}' not found in '{matrix}'.")
         return False
 
-    project_path = manifest["projects"][project_name].get("path")
-    del manifest["projects"][project_name]
-    save_manifest(matrix, manifest)
+    project_path = project.get("path")
+    delete_project(matrix, project_name)
 
     if project_path:
-        config_path = Path(project_path) / ".deep-mind.json"
-        if config_path.exists():
-            config_path.unlink()
+        try:
+            os.unlink(os.path.join(project_path, ".deep-mind.json"))
+        except FileNotFoundError:
+            pass
 
     log_change(matrix, f"Project '{project_name}' unregistered")
     print(f"Project '{project_name}' removed from '{matrix}'")
@@ -125,24 +365,26 @@ def unregister_project(matrix, project_name):
 
 
 def add_vertical(matrix, vertical_name):
-    mdir = get_matrix_dir(matrix)
-    if not mdir.exists():
+    mdir = _require_matrix(matrix)
+    if mdir is None:
         print(f"Error: Matrix '{matrix}' does not exist.")
         return False
 
-    manifest = load_manifest(matrix)
+    _ensure_migrated(matrix)
 
-    if vertical_name in manifest["verticals"]:
+    if vertical_name in load_verticals(matrix):
         print(f"Vertical '{vertical_name}' already exists in '{matrix}'.")
         return True
 
-    manifest["verticals"].append(vertical_name)
-    save_manifest(matrix, manifest)
+    append_vertical(matrix, vertical_name)
 
     # Create empty vertical file if it doesn't exist
-    vertical_file = mdir / f"{vertical_name}.md"
-    if not vertical_file.exists():
-        vertical_file.write_text(f"# {vertical_name.replace('-', ' ').title()}\n")
+    vertical_file = os.path.join(mdir, f"{vertical_name}.md")
+    try:
+        with open(vertical_file, "x") as f:
+            f.write(f"# {vertical_name.replace('-', ' ').title()}\n")
+    except FileExistsError:
+        pass
 
     log_change(matrix, f"Vertical '{vertical_name}' added")
     print(f"Vertical '{vertical_name}' added to '{matrix}'")
@@ -151,75 +393,167 @@ def add_vertical(matrix, vertical_name):
 
 
 def remove_vertical(matrix, vertical_name):
-    mdir = get_matrix_dir(matrix)
-    if not mdir.exists():
+    mdir = _require_matrix(matrix)
+    if mdir is None:
         print(f"Error: Matrix '{matrix}' does not exist.")
         return False
 
-    manifest = load_manifest(matrix)
+    _ensure_migrated(matrix)
+    verticals = load_verticals(matrix)
 
-    if vertical_name not in manifest["verticals"]:
+    if vertical_name not in verticals:
         print(f"Error: Vertical '{vertical_name}' not found in '{matrix}'.")
         return False
 
-    manifest["verticals"].remove(vertical_name)
-    save_manifest(matrix, manifest)
+    del verticals[vertical_name]
+    save_verticals(matrix, verticals)
 
-    vertical_file = mdir / f"{vertical_name}.md"
-    if vertical_file.exists():
-        vertical_file.unlink()
+    try:
+        os.unlink(os.path.join(mdir, f"{vertical_name}.md"))
+    except FileNotFoundError:
+        pass
 
     log_change(matrix, f"Vertical '{vertical_name}' removed")
     print(f"Vertical '{vertical_name}' removed from '{matrix}'")
     return True
 
 
+def _count_content_lines(path):
+    """Count non-blank, non-heading lines without loading the whole file."""
+    n = 0
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith(b"#"):
+                n += 1
+    return n
+
+
+def _count_vertical(mdir, vertical):
+    try:
+        return _count_content_lines(os.path.join(mdir, f"{vertical}.md"))
+    except FileNotFoundError:
+        return None
+
+
+# Below this many files to rescan, counting inline beats a thread pool
+_PARALLEL_SCAN_MIN = 8
+
+
+def _vertical_statuses(mdir, verticals):
+    """Status strings for verticals, in order, reusing counts for unchanged files.
+
+    Line counts are cached in ``.counts.json`` keyed by vertical name as
+    ``[mtime_ns, size, count]``; only files whose stat changed are rescanned.
+    """
+    if not verticals:
+        return []
+
+    stats = {}
+    with os.scandir(mdir) as it:
+        for e in it:
+            if e.name.endswith(".md") and e.is_file():
+                st = e.stat()
+                stats[e.name[:-3]] = [st.st_mtime_ns, st.st_size]
+
+    counts_path = os.path.join(mdir, ".counts.json")
+    try:
+        cached = _loads(_read_bytes(counts_path))
+    except (FileNotFoundError, ValueError):
+        cached = {}
+    if not isinstance(cached, dict):
+        cached = {}
+
+    counts = {}
+    for v in verticals:
+        entry = cached.get(v)
+        if (
+            v in stats
+            and isinstance(entry, list)
+            and len(entry) == 3
+            and entry[:2] == stats[v]
+            and isinstance(entry[2], int)
+        ):
+            counts[v] = entry
+    stale = [v for v in verticals if v in stats and v not in counts]
+    if len(stale) >= _PARALLEL_SCAN_MIN:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(32, len(stale))) as ex:
+            fresh = list(ex.map(lambda v: _count_vertical(mdir, v), stale))
+    else:
+        # Usually one or two edited files: not worth the import and pool startup
+        fresh = [_count_vertical(mdir, v) for v in stale]
+    for v, n in zip(stale, fresh):
+        if n is not None:
+            counts[v] = stats[v] + [n]
+
+    if counts != cached:
+        # The cache is an optimisation; a read-only matrix still lists fine
+        try:
+            _write_atomic(counts_path, _dumps(counts))
+        except OSError:
+            pass
+
+    statuses = []
+    for v in verticals:
+        if v not in counts:
+            statuses.append("no file")
+        elif counts[v][2]:
+            statuses.append(f"{counts[v][2]} lines")
+        else:
+            statuses.append("empty")
+    return statuses
+
+
 def list_verticals(matrix):
-    mdir = get_matrix_dir(matrix)
-    if not mdir.exists():
+    mdir = _require_matrix(matrix)
+    if mdir is None:
         print(f"Error: Matrix '{matrix}' does not exist.")
         return
 
-    manifest = load_manifest(matrix)
-    verticals = manifest.get("verticals", [])
+    verticals = load_verticals(matrix)
 
     if not verticals:
         print(f"No verticals in '{matrix}'.")
         return
 
-    for v in verticals:
-        vfile = mdir / f"{v}.md"
-        if vfile.exists():
-            content = vfile.read_text().strip()
-            lines = [
-                l
-                for l in content.split("\n")
-                if l.strip() and not l.strip().startswith("#")
-            ]
-            status = f"{len(lines)} lines" if lines else "empty"
-        else:
-            status = "no file"
-        print(f"  {v}: {status}")
+    out = []
+    for v, status in zip(verticals, _vertical_statuses(mdir, verticals)):
+        out.append(f"  {v}: {status}")
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _count_projects(matrix):
+    legacy = _legacy_field(matrix, "projects")
+    if legacy is not None:
+        return len(legacy)
+    try:
+        with os.scandir(os.path.join(get_matrix_dir(matrix), "projects")) as it:
+            return sum(1 for e in it if e.name.endswith(".json"))
+    except FileNotFoundError:
+        return 0
 
 
 def list_matrices():
-    if not BASE_DIR.exists():
-        print("No matrices found.")
-        return
+    try:
+        with os.scandir(BASE_DIR) as it:
+            dirs = [
+                e
+                for e in it
+                if e.is_dir(follow_symlinks=False)
+                and os.path.isfile(os.path.join(e.path, "manifest.json"))
+            ]
+    except FileNotFoundError:
+        dirs = []
 
-    dirs = [
-        d
-        for d in BASE_DIR.iterdir()
-        if d.is_dir() and (d / "manifest.json").exists()
-    ]
     if not dirs:
         print("No matrices found.")
         return
 
-    for d in sorted(dirs):
-        manifest = json.loads((d / "manifest.json").read_text())
-        pc = len(manifest.get("projects", {}))
-        vc = len(manifest.get("verticals", []))
+    for d in sorted(dirs, key=lambda e: e.name):
+        pc = _count_projects(d.name)
+        vc = len(load_verticals(d.name))
         print(f"  {d.name} ({pc} projects, {vc} verticals)")
 
 
@@ -232,113 +566,245 @@ def show_status(matrix=None):
             list_matrices()
             return
 
-    mdir = get_matrix_dir(matrix)
-    if not mdir.exists():
+    mdir = _require_matrix(matrix)
+    if mdir is None:
         print(f"Error: Matrix '{matrix}' not found.")
         return
 
     manifest = load_manifest(matrix)
+    projects = load_projects(matrix)
 
-    print(f"Matrix: {manifest['name']}")
-    print(f"Created: {manifest['created'][:10]}")
-
-    print(f"\nProjects ({len(manifest['projects'])}):")
-    for pname, pinfo in manifest["projects"].items():
-        print(f"  - {pname}: {pinfo['path']}")
+    out = [
+        f"Matrix: {manifest['name']}",
+        f"Created: {manifest['created'][:10]}",
+        f"\nProjects ({len(projects)}):",
+    ]
+    for pname, pinfo in projects.items():
+        out.append(f"  - {pname}: {pinfo['path']}")
 
-    verticals = manifest.get("verticals", [])
-    print(f"\nVerticals ({len(verticals)}):")
-    for v in verticals:
-        vfile = mdir / f"{v}.md"
-        if vfile.exists():
-            content = vfile.read_text().strip()
-            lines = [
-                l
-                for l in content.split("\n")
-                if l.strip() and not l.strip().startswith("#")
-            ]
-            status = f"{len(lines)} lines" if lines else "empty"
-        else:
-            status = "no file"
-        print(f"  - {v}: {status}")
+    verticals = load_verticals(matrix)
+    out.append(f"\nVerticals ({len(verticals)}):")
+    for v, status in zip(verticals, _vertical_statuses(mdir, verticals)):
+        out.append(f"  - {v}: {status}")
 
     if not verticals:
-        print("  (none)")
+        out.append("  (none)")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def list_projects(matrix):
-    mdir = get_matrix_dir(matrix)
-    if not mdir.exists():
+    mdir = _require_matrix(matrix)
+    if mdir is None:
         print(f"Error: Matrix '{matrix}' not found.")
         return
 
-    manifest = load_manifest(matrix)
+    projects = load_projects(matrix)
 
-    if not manifest["projects"]:
+    if not projects:
         print(f"No projects in '{matrix}'.")
         return
 
-    for pname, pinfo in manifest["projects"].items():
-        print(f"  {pname}: {pinfo['path']}")
+    out = [f"  {pname}: {pinfo['path']}" for pname, pinfo in projects.items()]
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _cat(path):
+    """Copy a file to stdout, in-kernel via sendfile where the platform allows."""
+    with open(path, "rb") as src:
+        sys.stdout.flush()
+        offset = 0
+        try:
+            size = os.fstat(src.fileno()).st_size
+            out_fd = sys.stdout.fileno()
+            while offset < size:
+                sent = os.sendfile(out_fd, src.fileno(), offset, size - offset)
+                if not sent:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            src.seek(offset)
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is None:
+                # Text-only stdout such as io.StringIO in in-process callers
+                sys.stdout.write(src.read().decode())
+            else:
+                import shutil
+
+                shutil.copyfileobj(src, buffer, 1 << 16)
 
 
 def read_brain(matrix, vertical=None):
-    mdir = get_matrix_dir(matrix)
-    if not mdir.exists():
+    mdir = _require_matrix(matrix)
+    if mdir is None:
         print(f"Error: Matrix '{matrix}' not found.")
         return
 
-    manifest = load_manifest(matrix)
-    verticals = manifest.get("verticals", [])
+    verticals = load_verticals(matrix)
 
     if vertical:
         if vertical not in verticals:
             print(f"Error: Vertical '{vertical}' not registered in '{matrix}'.")
             print(f"Available: {', '.join(verticals)}")
             return
-        vfile = mdir / f"{vertical}.md"
-        if not vfile.exists():
+        try:
+            _cat(os.path.join(mdir, f"{vertical}.md"))
+        except FileNotFoundError:
             print(f"Error: File for vertical '{vertical}' not found.")
             return
-        print(vfile.read_text())
+        sys.stdout.write("\n")
     else:
         if not verticals:
             print(f"No verticals in '{matrix}'.")
             return
+        with os.scandir(mdir) as it:
+            md_files = {
+                e.name[:-3]: e.path
+                for e in it
+                if e.name.endswith(".md") and e.is_file()
+            }
+        # Same framing as print(content); print() for each vertical
         for v in verticals:
-            vfile = mdir / f"{v}.md"
-            if vfile.exists():
-                print(vfile.read_text())
-                print()
+            if v in md_files:
+                _cat(md_files[v])
+                sys.stdout.write("\n\n")
 
 
 def log_change(matrix, message):
-    mdir = get_matrix_dir(matrix)
-    changelog = mdir / "changelog.md"
+    changelog = os.path.join(get_matrix_dir(matrix), "changelog.md")
 
-    entry = f"\n## {datetime.now().strftime('%Y-%m-%d %H:%M')}\n- {message}\n"
+    entry = f"\n## {_now().strftime('%Y-%m-%d %H:%M')}\n- {message}\n"
 
-    if changelog.exists():
-        content = changelog.read_text()
-        lines = content.split("\n", 1)
-        if len(lines) > 1:
-            content = lines[0] + "\n" + entry + lines[1]
-        else:
-            content = lines[0] + "\n" + entry
-        changelog.write_text(content)
-    else:
-        changelog.write_text(f"# Changelog\n{entry}")
+    # Entries are appended oldest-first so logging never rewrites the file
+    try:
+        with open(changelog, "xb") as f:
+            f.write(b"# Changelog\n")
+    except FileExistsError:
+        pass
+    with open(changelog, "ab", buffering=64 * 1024) as f:
+        f.write(entry.encode())
 
 
 def detect_project():
-    config_path = Path(os.getcwd()) / ".deep-mind.json"
-    if config_path.exists():
-        return json.loads(config_path.read_text())
-    return None
+    try:
+        return _loads(_read_bytes(".deep-mind.json"))
+    except FileNotFoundError:
+        return None
 
 
 def get_brain_path(matrix):
-    print(str(get_matrix_dir(matrix)))
+    print(get_matrix_dir(matrix))
+
+
+def _cmd_init(argv):
+    if len(argv) < 3:
+        print("Usage: deep_mind.py init <matrix-name>")
+        sys.exit(1)
+    init_matrix(argv[2])
+
+
+def _cmd_register(argv):
+    if len(argv) < 4:
+        print("Usage: deep_mind.py register <matrix> <project-name> [--path <path>]")
+        sys.exit(1)
+    path = None
+    if "--path" in argv:
+        idx = argv.index("--path")
+        if idx + 1 < len(argv):
+            path = argv[idx + 1]
+    register_project(argv[2], argv[3], path)
+
+
+def _cmd_unregister(argv):
+    if len(argv) < 4:
+        print("Usage: deep_mind.py unregister <matrix> <project-name>")
+        sys.exit(1)
+    unregister_project(argv[2], argv[3])
+
+
+def _cmd_status(argv):
+    mat = argv[2] if len(argv) > 2 else None
+    show_status(mat)
+
+
+def _cmd_list(argv):
+    list_matrices()
+
+
+def _cmd_projects(argv):
+    if len(argv) < 3:
+        print("Usage: deep_mind.py projects <matrix>")
+        sys.exit(1)
+    list_projects(argv[2])
+
+
+def _cmd_add_vertical(argv):
+    if len(argv) < 4:
+        print("Usage: deep_mind.py add-vertical <matrix> <vertical-name>")
+        sys.exit(1)
+    add_vertical(argv[2], argv[3])
+
+
+def _cmd_remove_vertical(argv):
+    if len(argv) < 4:
+        print("Usage: deep_mind.py remove-vertical <matrix> <vertical-name>")
+        sys.exit(1)
+    remove_vertical(argv[2], argv[3])
+
+
+def _cmd_list_verticals(argv):
+    if len(argv) < 3:
+        print("Usage: deep_mind.py list-verticals <matrix>")
+        sys.exit(1)
+    list_verticals(argv[2])
+
+
+def _cmd_read(argv):
+    if len(argv) < 3:
+        print("Usage: deep_mind.py read <matrix> [<vertical>]")
+        sys.exit(1)
+    v = argv[3] if len(argv) > 3 else None
+    read_brain(argv[2], v)
+
+
+def _cmd_log(argv):
+    if len(argv) < 4:
+        print("Usage: deep_mind.py log <matrix> <message>")
+        sys.exit(1)
+    log_change(argv[2], " ".join(argv[3:]))
+    print("Logged.")
+
+
+def _cmd_detect(argv):
+    result = detect_project()
+    if result:
+        print(_dumps(result).decode())
+    else:
+        print("No .deep-mind.json found in current directory.")
+
+
+def _cmd_path(argv):
+    if len(argv) < 3:
+        print("Usage: deep_mind.py path <matrix>")
+        sys.exit(1)
+    get_brain_path(argv[2])
+
+
+_COMMANDS = {
+    "init": _cmd_init,
+    "register": _cmd_register,
+    "unregister": _cmd_unregister,
+    "status": _cmd_status,
+    "list": _cmd_list,
+    "projects": _cmd_projects,
+    "add-vertical": _cmd_add_vertical,
+    "remove-vertical": _cmd_remove_vertical,
+    "list-verticals": _cmd_list_verticals,
+    "read": _cmd_read,
+    "log": _cmd_log,
+    "detect": _cmd_detect,
+    "path": _cmd_path,
+}
 
 
 def main():
@@ -362,92 +828,15 @@ def main():
         sys.exit(1)
 
     cmd = sys.argv[1]
-
-    if cmd == "init":
-        if len(sys.argv) < 3:
-            print("Usage: deep_mind.py init <matrix-name>")
-            sys.exit(1)
-        init_matrix(sys.argv[2])
-
-    elif cmd == "register":
-        if len(sys.argv) < 4:
-            print("Usage: deep_mind.py register <matrix> <project-name> [--path <path>]")
-            sys.exit(1)
-        path = None
-        if "--path" in sys.argv:
-            idx = sys.argv.index("--path")
-            if idx + 1 < len(sys.argv):
-                path = sys.argv[idx + 1]
-        register_project(sys.argv[2], sys.argv[3], path)
-
-    elif cmd == "unregister":
-        if len(sys.argv) < 4:
-            print("Usage: deep_mind.py unregister <matrix> <project-name>")
-            sys.exit(1)
-        unregister_project(sys.argv[2], sys.argv[3])
-
-    elif cmd == "status":
-        mat = sys.argv[2] if len(sys.argv) > 2 else None
-        show_status(mat)
-
-    elif cmd == "list":
-        list_matrices()
-
-    elif cmd == "projects":
-        if len(sys.argv) < 3:
-            print("Usage: deep_mind.py projects <matrix>")
-            sys.exit(1)
-        list_projects(sys.argv[2])
-
-    elif cmd == "add-vertical":
-        if len(sys.argv) < 4:
-            print("Usage: deep_mind.py add-vertical <matrix> <vertical-name>")
-            sys.exit(1)
-        add_vertical(sys.argv[2], sys.argv[3])
-
-    elif cmd == "remove-vertical":
-        if len(sys.argv) < 4:
-            print("Usage: deep_mind.py remove-vertical <matrix> <vertical-name>")
-            sys.exit(1)
-        remove_vertical(sys.argv[2], sys.argv[3])
-
-    elif cmd == "list-verticals":
-        if len(sys.argv) < 3:
-            print("Usage: deep_mind.py list-verticals <matrix>")
-            sys.exit(1)
-        list_verticals(sys.argv[2])
-
-    elif cmd == "read":
-        if len(sys.argv) < 3:
-            print("Usage: deep_mind.py read <matrix> [<vertical>]")
-            sys.exit(1)
-        v = sys.argv[3] if len(sys.argv) > 3 else None
-        read_brain(sys.argv[2], v)
-
-    elif cmd == "log":
-        if len(sys.argv) < 4:
-            print("Usage: deep_mind.py log <matrix> <message>")
-            sys.exit(1)
-        log_change(sys.argv[2], " ".join(sys.argv[3:]))
-        print("Logged.")
-
-    elif cmd == "detect":
-        result = detect_project()
-        if result:
-            print(json.dumps(result, indent=2))
-        else:
-            print("No .deep-mind.json found in current directory.")
-
-    elif cmd == "path":
-        if len(sys.argv) < 3:
-            print("Usage: deep_mind.py path <matrix>")
-            sys.exit(1)
-        get_brain_path(sys.argv[2])
-
-    else:
+    handler = _COMMANDS.get(cmd)
+    if not handler:
         print(f"Unknown command: {cmd}")
         sys.exit(1)
 
+    global _NOW_CACHE
+    _NOW_CACHE = None
+    handler(sys.argv)
+
 
 if __name__ == "__main__":
     main()